@@ -42,8 +42,10 @@ def meeting_transcription_differentiate_speakers():
     """differentiates speakers using meeting transcription service"""
     # Creates speech configuration with subscription information
     speech_config = speechsdk.SpeechConfig(subscription=speech_key, region=service_region)
-    speech_config.set_property_by_name("ConversationTranscriptionInRoomAndOnline", "true")
-    speech_config.set_property_by_name("DifferentiateGuestSpeakers", "true")
+    speech_config.set_properties_by_name({
+        "ConversationTranscriptionInRoomAndOnline": "true",
+        "DifferentiateGuestSpeakers": "true",
+    })
 
     channels = 8
     bits_per_sample = 16
@@ -57,14 +57,14 @@ def speech_recognize_once_from_mic():
 
     # Check the result
     if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-        print("Recognized: {}".format(result.text))
+        print(f"Recognized: {result.text}")
     elif result.reason == speechsdk.ResultReason.NoMatch:
         print("No speech could be recognized")
     elif result.reason == speechsdk.ResultReason.Canceled:
         cancellation_details = result.cancellation_details
-        print("Speech Recognition canceled: {}".format(cancellation_details.reason))
+        print(f"Speech Recognition canceled: {cancellation_details.reason}")
         if cancellation_details.reason == speechsdk.CancellationReason.Error:
-            print("Error details: {}".format(cancellation_details.error_details))
+            print(f"Error details: {cancellation_details.error_details}")
     # </SpeechRecognitionWithMicrophone>
 
 
@@ -87,14 +87,14 @@ def speech_recognize_once_from_file():
 
     # Check the result
     if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-        print("Recognized: {}".format(result.text))
+        print(f"Recognized: {result.text}")
     elif result.reason == speechsdk.ResultReason.NoMatch:
-        print("No speech could be recognized: {}".format(result.no_match_details))
+        print(f"No speech could be recognized: {result.no_match_details}")
     elif result.reason == speechsdk.ResultReason.Canceled:
         cancellation_details = result.cancellation_details
-        print("Speech Recognition canceled: {}".format(cancellation_details.reason))
+        print(f"Speech Recognition canceled: {cancellation_details.reason}")
         if cancellation_details.reason == speechsdk.CancellationReason.Error:
-            print("Error details: {}".format(cancellation_details.error_details))
+            print(f"Error details: {cancellation_details.error_details}")
     # </SpeechRecognitionWithFile>
 
 
@@ -129,22 +129,22 @@ def speech_recognize_once_from_file_with_detailed_recognition_results():
 
     # Check the result
     if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-        print("Recognized: {}".format(result.text))
+        print(f"Recognized: {result.text}")
 
         # Time units are in hundreds of nanoseconds (HNS), where 10000 HNS equals 1 millisecond
-        print("Offset: {}".format(result.offset))
-        print("Duration: {}".format(result.duration))
+        print(f"Offset: {result.offset}")
+        print(f"Duration: {result.duration}")
 
         # Now get the detailed recognition results from the JSON
         json_result = json.loads(result.json)
 
         # The first cell in the NBest list corresponds to the recognition results
         # (NOT the cell with the highest confidence number!)
-        print("Detailed results - Lexical: {}".format(json_result['NBest'][0]['Lexical']))
+        print(f"Detailed results - Lexical: {json_result['NBest'][0]['Lexical']}")
         # ITN stands for Inverse Text Normalization
-        print("Detailed results - ITN: {}".format(json_result['NBest'][0]['ITN']))
-        print("Detailed results - MaskedITN: {}".format(json_result['NBest'][0]['MaskedITN']))
-        print("Detailed results - Display: {}".format(json_result['NBest'][0]['Display']))
+        print(f"Detailed results - ITN: {json_result['NBest'][0]['ITN']}")
+        print(f"Detailed results - MaskedITN: {json_result['NBest'][0]['MaskedITN']}")
+        print(f"Detailed results - Display: {json_result['NBest'][0]['Display']}")
 
         # Print word-level timing. Time units are HNS.
         words = json_result['NBest'][0]['Words']
@@ -155,12 +155,12 @@ def speech_recognize_once_from_file_with_detailed_recognition_results():
         # You can access alternative recognition results through json_result['NBest'][i], i=1,2,..
 
     elif result.reason == speechsdk.ResultReason.NoMatch:
-        print("No speech could be recognized: {}".format(result.no_match_details))
+        print(f"No speech could be recognized: {result.no_match_details}")
     elif result.reason == speechsdk.ResultReason.Canceled:
         cancellation_details = result.cancellation_details
-        print("Speech Recognition canceled: {}".format(cancellation_details.reason))
+        print(f"Speech Recognition canceled: {cancellation_details.reason}")
         if cancellation_details.reason == speechsdk.CancellationReason.Error:
-            print("Error details: {}".format(cancellation_details.error_details))
+            print(f"Error details: {cancellation_details.error_details}")
     # </SpeechRecognitionFromFileWithDetailedRecognitionResults>
 
 
@@ -212,14 +212,14 @@ def speech_recognize_once_compressed_input():
 
     # Check the result
     if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-        print("Recognized: {}".format(result.text))
+        print(f"Recognized: {result.text}")
     elif result.reason == speechsdk.ResultReason.NoMatch:
-        print("No speech could be recognized: {}".format(result.no_match_details))
+        print(f"No speech could be recognized: {result.no_match_details}")
     elif result.reason == speechsdk.ResultReason.Canceled:
         cancellation_details = result.cancellation_details
-        print("Speech Recognition canceled: {}".format(cancellation_details.reason))
+        print(f"Speech Recognition canceled: {cancellation_details.reason}")
         if cancellation_details.reason == speechsdk.CancellationReason.Error:
-            print("Error details: {}".format(cancellation_details.error_details))
+            print(f"Error details: {cancellation_details.error_details}")
     # </SpeechRecognitionWithCompressedFile>
 
 
@@ -248,14 +248,14 @@ def speech_recognize_once_from_file_with_customized_model():
 
     # Check the result
     if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-        print("Recognized: {}".format(result.text))
+        print(f"Recognized: {result.text}")
     elif result.reason == speechsdk.ResultReason.NoMatch:
-        print("No speech could be recognized: {}".format(result.no_match_details))
+        print(f"No speech could be recognized: {result.no_match_details}")
     elif result.reason == speechsdk.ResultReason.Canceled:
         cancellation_details = result.cancellation_details
-        print("Speech Recognition canceled: {}".format(cancellation_details.reason))
+        print(f"Speech Recognition canceled: {cancellation_details.reason}")
         if cancellation_details.reason == speechsdk.CancellationReason.Error:
-            print("Error details: {}".format(cancellation_details.error_details))
+            print(f"Error details: {cancellation_details.error_details}")
     # </SpeechRecognitionUsingCustomizedModel>
 
 
@@ -283,14 +283,14 @@ def speech_recognize_once_from_file_with_custom_endpoint_parameters():
 
     # Check the result
     if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-        print("Recognized: {}".format(result.text))
+        print(f"Recognized: {result.text}")
     elif result.reason == speechsdk.ResultReason.NoMatch:
-        print("No speech could be recognized: {}".format(result.no_match_details))
+        print(f"No speech could be recognized: {result.no_match_details}")
     elif result.reason == speechsdk.ResultReason.Canceled:
         cancellation_details = result.cancellation_details
-        print("Speech Recognition canceled: {}".format(cancellation_details.reason))
+        print(f"Speech Recognition canceled: {cancellation_details.reason}")
         if cancellation_details.reason == speechsdk.CancellationReason.Error:
-            print("Error details: {}".format(cancellation_details.error_details))
+            print(f"Error details: {cancellation_details.error_details}")
 
 
 def speech_recognize_async_from_file():
@@ -315,14 +315,14 @@ def speech_recognize_async_from_file():
 
     # Check the result
     if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-        print("Recognized: {}".format(result.text))
+        print(f"Recognized: {result.text}")
     elif result.reason == speechsdk.ResultReason.NoMatch:
-        print("No speech could be recognized: {}".format(result.no_match_details))
+        print(f"No speech could be recognized: {result.no_match_details}")
     elif result.reason == speechsdk.ResultReason.Canceled:
         cancellation_details = result.cancellation_details
-        print("Speech Recognition canceled: {}".format(cancellation_details.reason))
+        print(f"Speech Recognition canceled: {cancellation_details.reason}")
         if cancellation_details.reason == speechsdk.CancellationReason.Error:
-            print("Error details: {}".format(cancellation_details.error_details))
+            print(f"Error details: {cancellation_details.error_details}")
 
 
 def speech_recognize_continuous_from_file():
@@ -333,13 +333,12 @@ def speech_recognize_continuous_from_file():
 
     speech_recognizer = speechsdk.SpeechRecognizer(speech_config=speech_config, audio_config=audio_config)
 
-    done = False
+    recognition_done = threading.Event()
 
     def stop_cb(evt: speechsdk.SessionEventArgs):
         """callback that signals to stop continuous recognition upon receiving an event `evt`"""
         print('CLOSING on {}'.format(evt))
-        nonlocal done
-        done = True
+        recognition_done.set()
 
     # Connect callbacks to the events fired by the speech recognizer
     speech_recognizer.recognizing.connect(lambda evt: print('RECOGNIZING: {}'.format(evt)))
@@ -353,8 +352,7 @@ def speech_recognize_continuous_from_file():
 
     # Start continuous speech recognition
     speech_recognizer.start_continuous_recognition()
-    while not done:
-        time.sleep(.5)
+    recognition_done.wait()
 
     speech_recognizer.stop_continuous_recognition()
     # </SpeechContinuousRecognitionWithFile>
@@ -422,13 +420,12 @@ def speech_recognize_keyword_from_microphone():
 
     speech_recognizer = speechsdk.SpeechRecognizer(speech_config=speech_config)
 
-    done = False
+    recognition_done = threading.Event()
 
     def stop_cb(evt: speechsdk.SessionEventArgs):
         """callback that signals to stop continuous recognition upon receiving an event `evt`"""
         print('CLOSING on {}'.format(evt))
-        nonlocal done
-        done = True
+        recognition_done.set()
 
     def recognizing_cb(evt: speechsdk.SpeechRecognitionEventArgs):
         """callback for recognizing event"""
@@ -459,8 +456,7 @@ def speech_recognize_keyword_from_microphone():
     # Start keyword recognition
     speech_recognizer.start_keyword_recognition(model)
     print('Say something starting with "{}" followed by whatever you want...'.format(keyword))
-    while not done:
-        time.sleep(.5)
+    recognition_done.wait()
 
     speech_recognizer.stop_keyword_recognition()
 # </SpeechRecognitionUsingKeywordModel>
@@ -510,13 +506,12 @@ def speech_recognition_with_pull_stream():
     # Instantiate the speech recognizer with pull stream input
     speech_recognizer = speechsdk.SpeechRecognizer(speech_config=speech_config, audio_config=audio_config)
 
-    done = False
+    recognition_done = threading.Event()
 
     def stop_cb(evt: speechsdk.SessionEventArgs):
         """callback that signals to stop continuous recognition upon receiving an event `evt`"""
         print('CLOSING on {}'.format(evt))
-        nonlocal done
-        done = True
+        recognition_done.set()
 
     # Connect callbacks to the events fired by the speech recognizer
     speech_recognizer.recognizing.connect(lambda evt: print('RECOGNIZING: {}'.format(evt)))
@@ -531,8 +526,7 @@ def speech_recognition_with_pull_stream():
     # Start continuous speech recognition
     speech_recognizer.start_continuous_recognition()
 
-    while not done:
-        time.sleep(.5)
+    recognition_done.wait()
 
     speech_recognizer.stop_continuous_recognition()
 
@@ -638,9 +632,8 @@ def speech_recognition_with_push_stream_mulaw():
     # Open the wav file and push it to the push stream.
     # NOTE the wav header must be skipped before pushing the data to the stream.
     with open(weatherfilenamemulaw, 'rb') as audio_file:
-        wav_header_size = utils.get_wav_header_size(weatherfilenamemulaw)
-        # Read the wave header
-        header = audio_file.read(wav_header_size)  # noqa: F841 # pylint: disable=unused-variable
+        # Skip the wave header
+        utils.skip_wav_header(audio_file)
         # Read the audio data
         audio_data = audio_file.read()
         stream.write(audio_data)
@@ -667,14 +660,14 @@ def speech_recognize_once_with_auto_language_detection_from_mic():
     # Check the result
     if result.reason == speechsdk.ResultReason.RecognizedSpeech:
         auto_detect_source_language_result = speechsdk.AutoDetectSourceLanguageResult(result)
-        print("Recognized: {} in language {}".format(result.text, auto_detect_source_language_result.language))
+        print(f"Recognized: {result.text} in language {auto_detect_source_language_result.language}")
     elif result.reason == speechsdk.ResultReason.NoMatch:
         print("No speech could be recognized")
     elif result.reason == speechsdk.ResultReason.Canceled:
         cancellation_details = result.cancellation_details
-        print("Speech Recognition canceled: {}".format(cancellation_details.reason))
+        print(f"Speech Recognition canceled: {cancellation_details.reason}")
         if cancellation_details.reason == speechsdk.CancellationReason.Error:
-            print("Error details: {}".format(cancellation_details.error_details))
+            print(f"Error details: {cancellation_details.error_details}")
 
 
 def speech_recognize_with_auto_language_detection_UsingCustomizedModel():
@@ -703,14 +696,14 @@ def speech_recognize_with_auto_language_detection_UsingCustomizedModel():
     # Check the result
     if result.reason == speechsdk.ResultReason.RecognizedSpeech:
         auto_detect_source_language_result = speechsdk.AutoDetectSourceLanguageResult(result)
-        print("Recognized: {} in language {}".format(result.text, auto_detect_source_language_result.language))
+        print(f"Recognized: {result.text} in language {auto_detect_source_language_result.language}")
     elif result.reason == speechsdk.ResultReason.NoMatch:
         print("No speech could be recognized")
     elif result.reason == speechsdk.ResultReason.Canceled:
         cancellation_details = result.cancellation_details
-        print("Speech Recognition canceled: {}".format(cancellation_details.reason))
+        print(f"Speech Recognition canceled: {cancellation_details.reason}")
         if cancellation_details.reason == speechsdk.CancellationReason.Error:
-            print("Error details: {}".format(cancellation_details.error_details))
+            print(f"Error details: {cancellation_details.error_details}")
 
 
 def speech_recognize_keyword_locally_from_microphone():
@@ -821,7 +814,7 @@ def pronunciation_assessment_from_microphone():
 
         # Check the result
         if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-            print('Recognized: {}'.format(result.text))
+            print(f'Recognized: {result.text}')
             print('  Pronunciation Assessment Result:')
 
             pronunciation_result = speechsdk.PronunciationAssessmentResult(result)
@@ -838,9 +831,9 @@ def pronunciation_assessment_from_microphone():
             print("No speech could be recognized")
         elif result.reason == speechsdk.ResultReason.Canceled:
             cancellation_details = result.cancellation_details
-            print("Speech Recognition canceled: {}".format(cancellation_details.reason))
+            print(f"Speech Recognition canceled: {cancellation_details.reason}")
             if cancellation_details.reason == speechsdk.CancellationReason.Error:
-                print("Error details: {}".format(cancellation_details.error_details))
+                print(f"Error details: {cancellation_details.error_details}")
 
 
 def pronunciation_assessment_continuous_from_file():
@@ -874,7 +867,7 @@ def pronunciation_assessment_continuous_from_file():
     # Apply pronunciation assessment config to speech recognizer
     pronunciation_config.apply_to(speech_recognizer)
 
-    done = False
+    recognition_done = threading.Event()
     recognized_words = []
     prosody_scores = []
     fluency_scores = []
@@ -883,8 +876,7 @@ def pronunciation_assessment_continuous_from_file():
     def stop_cb(evt: speechsdk.SessionEventArgs):
         """callback that signals to stop continuous recognition upon receiving an event `evt`"""
         print('CLOSING on {}'.format(evt))
-        nonlocal done
-        done = True
+        recognition_done.set()
 
     def recognized(evt: speechsdk.SpeechRecognitionEventArgs):
         print("pronunciation assessment for: {}".format(evt.result.text))
@@ -914,8 +906,7 @@ def pronunciation_assessment_continuous_from_file():
 
     # Start continuous pronunciation assessment
     speech_recognizer.start_continuous_recognition()
-    while not done:
-        time.sleep(.5)
+    recognition_done.wait()
 
     speech_recognizer.stop_continuous_recognition()
 
@@ -1037,9 +1028,9 @@ def pronunciation_assessment_from_stream():
         print("No speech could be recognized")
     elif result.reason == speechsdk.ResultReason.Canceled:
         cancellation_details = result.cancellation_details
-        print("Speech Recognition canceled: {}".format(cancellation_details.reason))
+        print(f"Speech Recognition canceled: {cancellation_details.reason}")
         if cancellation_details.reason == speechsdk.CancellationReason.Error:
-            print("Error details: {}".format(cancellation_details.error_details))
+            print(f"Error details: {cancellation_details.error_details}")
 
 
 def pronunciation_assessment_configured_with_json():
@@ -1084,9 +1075,9 @@ def pronunciation_assessment_configured_with_json():
         print("No speech could be recognized")
     elif result.reason == speechsdk.ResultReason.Canceled:
         cancellation_details = result.cancellation_details
-        print("Speech Recognition canceled: {}".format(cancellation_details.reason))
+        print(f"Speech Recognition canceled: {cancellation_details.reason}")
         if cancellation_details.reason == speechsdk.CancellationReason.Error:
-            print("Error details: {}".format(cancellation_details.error_details))
+            print(f"Error details: {cancellation_details.error_details}")
 
 
 def pronunciation_assessment_with_content_assessment():
@@ -1116,15 +1107,14 @@ def pronunciation_assessment_with_content_assessment():
     # Apply pronunciation assessment config to speech recognizer
     pronunciation_config.apply_to(speech_recognizer)
 
-    done = False
+    recognition_done = threading.Event()
     pron_results = []
     recognized_text = ""
 
     def stop_cb(evt):
         """callback that signals to stop continuous recognition upon receiving an event `evt`"""
         print("CLOSING on {}".format(evt))
-        nonlocal done
-        done = True
+        recognition_done.set()
 
     def recognized(evt):
         nonlocal pron_results, recognized_text
@@ -1145,8 +1135,7 @@ def pronunciation_assessment_with_content_assessment():
 
     # Start continuous pronunciation assessment
     speech_recognizer.start_continuous_recognition()
-    while not done:
-        time.sleep(.5)
+    recognition_done.wait()
     speech_recognizer.stop_continuous_recognition()
 
     # Content assessment result is in the last pronunciation assessment block
@@ -7,21 +7,21 @@
 import struct
 
 
-# Utility function to get the header size of a WAV file
-def get_wav_header_size(wav_file):
-    with open(wav_file, 'rb') as f:
-        # Read RIFF chunk descriptor
-        riff, chunk_size, fmt = struct.unpack('<4sI4s', f.read(12))
-        if riff != b'RIFF' or fmt != b'WAVE':
-            raise ValueError("Invalid WAV file format")
+# Utility function to position an open WAV file at the start of its audio data.
+# Returns the header size.
+def skip_wav_header(wav_file):
+    # Read RIFF chunk descriptor
+    riff, chunk_size, fmt = struct.unpack('<4sI4s', wav_file.read(12))
+    if riff != b'RIFF' or fmt != b'WAVE':
+        raise ValueError("Invalid WAV file format")
 
-        while True:
-            # Read sub-chunk header
-            sub_chunk_id, sub_chunk_size = struct.unpack('<4sI', f.read(8))
+    while True:
+        # Read sub-chunk header
+        sub_chunk_id, sub_chunk_size = struct.unpack('<4sI', wav_file.read(8))
 
-            if sub_chunk_id == b'data':
-                # Return the current file position as header size
-                return f.tell()
+        if sub_chunk_id == b'data':
+            # Return the current file position as header size
+            return wav_file.tell()
 
-            # Skip the sub-chunk data
-            f.seek(sub_chunk_size, 1)
+        # Skip the sub-chunk data
+        wav_file.seek(sub_chunk_size, 1)
@@ -31,6 +31,8 @@ CONVERSATION_SUMMARY_MODEL_VERSION = "2022-05-15-preview"
 WAIT_SECONDS = 10
 
 class TranscriptionPhrase(object) :
+    __slots__ = ("id", "text", "itn", "lexical", "speaker_number", "offset", "offset_in_ticks")
+
     def __init__(self, id : int, text : str, itn : str, lexical : str, speaker_number : int, offset : str, offset_in_ticks : float) :
         self.id = id
         self.text = text
@@ -41,17 +43,23 @@ class TranscriptionPhrase(object) :
         self.offset_in_ticks = offset_in_ticks
         
 class SentimentAnalysisResult(object) :
+    __slots__ = ("speaker_number", "offset_in_ticks", "document")
+
     def __init__(self, speaker_number : int, offset_in_ticks : float, document : Dict) :
         self.speaker_number = speaker_number
         self.offset_in_ticks = offset_in_ticks
         self.document = document
 
 class ConversationAnalysisSummaryItem(object) :
+    __slots__ = ("aspect", "summary")
+
     def __init__(self, aspect : str, summary : str) :
         self.aspect = aspect
         self.summary = summary
 
 class ConversationAnalysisPiiItem(object) :
+    __slots__ = ("category", "text")
+
     def __init__(self, category : str, text : str) :
         self.category = category
         self.text = text
@@ -9,6 +9,8 @@ import azure.cognitiveservices.speech as speechsdk # type: ignore
 import helper
 
 class Caption(object) :
+    __slots__ = ("language", "sequence", "begin", "end", "text")
+
     def __init__(self, language : Optional[str], sequence : int, begin : time, end : time, text : str) :
         self.language = language
         self.sequence = sequence